@@ -1,19 +1,30 @@
 #!/usr/bin/python3
 """ Amenity module for DBStorage """
 
-from sqlalchemy import Column, String
-from sqlalchemy.orm import relationship
-from models.base_model import BaseModel, Base
+from os import getenv
+from models.base_model import BaseModel
+
+storage_t = getenv('HBNB_TYPE_STORAGE')
+
+if storage_t == 'db':
+    from sqlalchemy import Column, String
+    from sqlalchemy.orm import relationship
+    from models.base_model import Base
+else:
+    Base = object
+
 
 class Amenity(BaseModel, Base):
     """ Amenity class for DBStorage """
-    __tablename__ = 'amenities'
-    name = Column(String(128), nullable=False)
-
-    # Many-to-Many relationship to Place (defined in place.py)
-    place_amenities = relationship(
-        "Place",
-        secondary="place_amenity",
-        back_populates="amenities"
-    )
+    if storage_t == 'db':
+        __tablename__ = 'amenities'
+        name = Column(String(128), nullable=False)
 
+        # Many-to-Many relationship to Place (defined in place.py)
+        place_amenities = relationship(
+            "Place",
+            secondary="place_amenity",
+            back_populates="amenities"
+        )
+    else:
+        name = ""
@@ -1,20 +1,50 @@
-def classes(self):
-    """Returns a dictionary of valid classes"""
-    from models.base_model import BaseModel
-    from models.user import User
-    from models.state import State
-    from models.city import City
-    from models.amenity import Amenity
-    from models.place import Place
-    from models.review import Review
-
-    return {
-        'BaseModel': BaseModel,
-        'User': User,
-        'State': State,
-        'City': City,
-        'Amenity': Amenity,
-        'Place': Place,
-        'Review': Review
-    }
+import importlib
+from types import MappingProxyType
 
+# Model modules, imported only when one of their classes is first needed
+_modules = {
+    'BaseModel': 'models.base_model',
+    'User': 'models.user',
+    'State': 'models.state',
+    'City': 'models.city',
+    'Amenity': 'models.amenity',
+    'Place': 'models.place',
+    'Review': 'models.review'
+}
+
+# Classes already resolved, keyed by class name
+_registry = {}
+_view = MappingProxyType(_registry)
+
+
+def register(cls, name=None):
+    """Adds a model class to the registry"""
+    _registry[name or cls.__name__] = cls
+    return cls
+
+
+def get_class(name):
+    """Returns the class registered as name, or None if unknown
+
+    This is the lookup to use on hot paths such as validating a class
+    name per command or per reloaded entry: it is a single dict lookup
+    and only imports the model module the first time it is needed.
+    """
+    cls = _registry.get(name)
+    if cls is None and name in _modules:
+        module = importlib.import_module(_modules[name])
+        cls = register(getattr(module, name), name)
+    return cls
+
+
+def classes(self=None):
+    """Returns a read-only mapping of every valid class
+
+    All built-in model modules are imported on the first call; later
+    calls return the same live view without copying. Prefer
+    get_class() when only one name is needed.
+    """
+    for name in _modules:
+        if name not in _registry:
+            get_class(name)
+    return _view
@@ -1,47 +1,198 @@
 #!/usr/bin/python3
 """ Place module for DBStorage """
 
-from sqlalchemy import Column, String, Integer, Float, ForeignKey, Table
-from sqlalchemy.orm import relationship
-from models.base_model import BaseModel, Base
-
-# Association table for many-to-many Place <-> Amenity
-place_amenity = Table(
-    'place_amenity',
-    Base.metadata,
-    Column('place_id', String(60), ForeignKey('places.id'), primary_key=True, nullable=False),
-    Column('amenity_id', String(60), ForeignKey('amenities.id'), primary_key=True, nullable=False)
-)
+from os import getenv
+from models.base_model import BaseModel
+
+storage_t = getenv('HBNB_TYPE_STORAGE')
+
+if storage_t == 'db':
+    from sqlalchemy import Column, String, ForeignKey, Table
+    from sqlalchemy.orm import relationship
+    from models.base_model import Base
+
+    # Association table for many-to-many Place <-> Amenity
+    place_amenity = Table(
+        'place_amenity',
+        Base.metadata,
+        Column('place_id', String(60), ForeignKey('places.id'), primary_key=True, nullable=False),
+        Column('amenity_id', String(60), ForeignKey('amenities.id'), primary_key=True, nullable=False)
+    )
+else:
+    Base = object
+
+
+class AmenityIds(list):
+    """Insertion-ordered list of amenity ids with set-backed membership
+
+    Every method that changes the contents keeps the set in sync.
+    Adding an id that is already linked is a no-op, while assigning one
+    over another entry raises ValueError. sort() and reverse() only
+    reorder, so they are inherited from list unchanged.
+    """
+
+    def __init__(self, ids=(), owner=None):
+        super().__init__()
+        self._ids = set()
+        self._owner = None
+        self.extend(ids or ())
+        self._owner = owner
+
+    def _attach(self):
+        """Stores this collection on its Place the first time it grows"""
+        if self._owner is not None:
+            self._owner.__dict__.setdefault('amenity_ids', self)
+            self._owner = None
+
+    def _reset(self, ids):
+        """Replaces the contents with ids, dropping duplicates"""
+        ids = list(ids)
+        super().clear()
+        self._ids = set()
+        self.extend(ids)
+
+    def __contains__(self, amenity_id):
+        """Checks whether amenity_id is linked in O(1)"""
+        return amenity_id in self._ids
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+    def copy(self):
+        """Returns a shallow copy as another AmenityIds"""
+        return type(self)(self)
+
+    def append(self, amenity_id):
+        """Adds amenity_id unless it is already linked"""
+        if amenity_id not in self._ids:
+            self._attach()
+            self._ids.add(amenity_id)
+            super().append(amenity_id)
+
+    def extend(self, ids):
+        """Adds every id not already linked, keeping their order"""
+        for amenity_id in ids:
+            self.append(amenity_id)
+
+    def insert(self, index, amenity_id):
+        """Inserts amenity_id at index unless it is already linked"""
+        if amenity_id not in self._ids:
+            self._attach()
+            self._ids.add(amenity_id)
+            super().insert(index, amenity_id)
+
+    def __iadd__(self, ids):
+        """Adds every id not already linked, like extend()"""
+        self.extend(ids)
+        return self
+
+    def __imul__(self, n):
+        """Keeps the ids for n >= 1, since repeats would be duplicates"""
+        if n <= 0:
+            self.clear()
+        return self
+
+    def __setitem__(self, index, value):
+        """Replaces ids in place, raising ValueError on a duplicate"""
+        if isinstance(index, slice):
+            new = list(value)
+            kept = self._ids.difference(super().__getitem__(index))
+            if len(set(new)) != len(new) or kept.intersection(new):
+                raise ValueError("amenity id already linked")
+            if new:
+                self._attach()
+            super().__setitem__(index, new)
+            self._ids = kept.union(new)
+            return
+        old = super().__getitem__(index)
+        if value == old:
+            return
+        if value in self._ids:
+            raise ValueError("amenity id already linked: {}".format(value))
+        super().__setitem__(index, value)
+        self._ids.discard(old)
+        self._ids.add(value)
+
+    def __delitem__(self, index):
+        """Removes the ids at index, which may be a slice"""
+        removed = super().__getitem__(index)
+        super().__delitem__(index)
+        if isinstance(index, slice):
+            self._ids.difference_update(removed)
+        else:
+            self._ids.discard(removed)
+
+    def remove(self, amenity_id):
+        """Removes amenity_id, raising ValueError if it is not linked"""
+        super().remove(amenity_id)
+        self._ids.discard(amenity_id)
+
+    def discard(self, *ids):
+        """Removes every given id that is linked, ignoring the others"""
+        gone = self._ids.intersection(ids)
+        if gone:
+            self._reset(i for i in self if i not in gone)
+
+    def pop(self, index=-1):
+        """Removes and returns the id at index, the last one by default"""
+        amenity_id = super().pop(index)
+        self._ids.discard(amenity_id)
+        return amenity_id
+
+    def clear(self):
+        """Removes every id"""
+        super().clear()
+        self._ids.clear()
+
 
 class Place(BaseModel, Base):
     """ Place class for DBStorage """
-    __tablename__ = 'places'
-    # (other column definitions here...)
-
-    # Many-to-Many relationship to Amenity
-    amenities = relationship(
-        "Amenity",
-        secondary=place_amenity,
-        viewonly=False,
-        back_populates="place_amenities"
-    )
+    if storage_t == 'db':
+        __tablename__ = 'places'
+        # (other column definitions here...)
+
+        # Many-to-Many relationship to Amenity
+        amenities = relationship(
+            "Amenity",
+            secondary=place_amenity,
+            viewonly=False,
+            back_populates="place_amenities"
+        )
+    else:
+        @property
+        def amenity_ids(self):
+            """Ids of the amenities linked to this Place.
+
+            A Place that never linked an amenity has no amenity_ids
+            attribute; it gets one the first time an id is added.
+            """
+            ids = self.__dict__.get('amenity_ids')
+            return ids if ids is not None else AmenityIds(owner=self)
+
+        @amenity_ids.setter
+        def amenity_ids(self, ids):
+            """Replaces the linked ids, e.g. the list read back by reload."""
+            self.__dict__['amenity_ids'] = AmenityIds(ids)
 
-    # For FileStorage (if applicable)
-    @property
-    def amenities(self):
-        """Getter for amenities linked to this Place."""
-        from models import storage
-        from models.amenity import Amenity
-        amenity_list = []
-        for amenity_id in self.amenity_ids:
-            amenity = storage.get(Amenity, amenity_id)
-            if amenity:
-                amenity_list.append(amenity)
-        return amenity_list
-
-    @amenities.setter
-    def amenities(self, obj):
-        """Setter for amenities linked to this Place."""
-        if type(obj) == Amenity and obj.id not in self.amenity_ids:
-            self.amenity_ids.append(obj.id)
+        # For FileStorage (if applicable)
+        @property
+        def amenities(self):
+            """Getter for amenities linked to this Place."""
+            from models import storage
+            from models.amenity import Amenity
+            if not self.amenity_ids:
+                return []
+            get_many = getattr(storage, 'get_many', None)
+            if get_many is not None:
+                amenities = get_many(Amenity, list(self.amenity_ids))
+            else:
+                amenities = (storage.get(Amenity, amenity_id)
+                             for amenity_id in self.amenity_ids)
+            return [amenity for amenity in amenities if amenity]
 
+        @amenities.setter
+        def amenities(self, obj):
+            """Setter for amenities linked to this Place."""
+            from models.amenity import Amenity
+            if type(obj) == Amenity:
+                self.amenity_ids.append(obj.id)
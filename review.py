@@ -1,10 +1,22 @@
-from sqlalchemy import Column, String, ForeignKey
-from sqlalchemy.orm import relationship
-from models.base_model import BaseModel, Base
+from os import getenv
+from models.base_model import BaseModel
 
-class Review(BaseModel, Base):
-    __tablename__ = "reviews"
-    place_id = Column(String(60), ForeignKey('places.id'), nullable=False)
-    user_id = Column(String(60), ForeignKey('users.id'), nullable=False)
-    text = Column(String(1024), nullable=False)
+storage_t = getenv('HBNB_TYPE_STORAGE')
+
+if storage_t == 'db':
+    from sqlalchemy import Column, String, ForeignKey
+    from models.base_model import Base
+else:
+    Base = object
 
+
+class Review(BaseModel, Base):
+    if storage_t == 'db':
+        __tablename__ = "reviews"
+        place_id = Column(String(60), ForeignKey('places.id'), nullable=False)
+        user_id = Column(String(60), ForeignKey('users.id'), nullable=False)
+        text = Column(String(1024), nullable=False)
+    else:
+        place_id = ""
+        user_id = ""
+        text = ""
@@ -0,0 +1,18 @@
+#!/bin/bash
+# Cold-start import cost of the models package for each storage mode
+# Usage: ./startup_bench.sh
+#
+# Run from the repository root with the models package importable.
+# db mode may need a reachable MySQL and the HBNB_MYSQL_* variables if
+# importing models opens the database. File mode only stays free of
+# sqlalchemy if models/__init__.py and models/base_model.py also avoid
+# importing it; the model modules themselves are checked by
+# tests/test_models/test_model_imports.py.
+
+for mode in file db; do
+    log=$(HBNB_TYPE_STORAGE=$mode python3 -X importtime -c "import models" 2>&1)
+    total=$(echo "$log" | awk -F'|' '$3 ~ /^ models$/ {gsub(/ /, "", $2); print $2}')
+    sqla=$(echo "$log" | grep -cE '\| +sqlalchemy$')
+    mysql=$(echo "$log" | grep -cE '\| +MySQLdb$')
+    echo "$mode: models ${total:-?} us, sqlalchemy imported: $sqla, MySQLdb imported: $mysql"
+done
@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+"""
+Test cases for the model class registry in file_storage
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+from models.engine import file_storage
+
+
+class TestClassRegistry(unittest.TestCase):
+    """Test cases for get_class, register and classes"""
+
+    def tearDown(self):
+        """Drop classes registered by the tests"""
+        file_storage._registry.pop('Dummy', None)
+
+    def test_get_class_imports_on_first_use(self):
+        """Test a model module is only imported when first looked up"""
+        code = (
+            "import sys\n"
+            "from models.engine import file_storage\n"
+            "assert 'models.review' not in sys.modules\n"
+            "cls = file_storage.get_class('Review')\n"
+            "assert 'models.review' in sys.modules\n"
+            "assert cls.__name__ == 'Review'\n"
+            "assert file_storage.get_class('Review') is cls\n"
+        )
+        env = dict(os.environ, HBNB_TYPE_STORAGE='file')
+        result = subprocess.run([sys.executable, "-c", code], env=env,
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_get_class_unknown_name(self):
+        """Test an unknown class name returns None"""
+        self.assertIsNone(file_storage.get_class('NotAModel'))
+        self.assertNotIn('NotAModel', file_storage.classes())
+
+    def test_register_adds_class(self):
+        """Test a registered class is returned by get_class and classes"""
+        class Dummy:
+            pass
+
+        self.assertIs(file_storage.register(Dummy), Dummy)
+        self.assertIs(file_storage.get_class('Dummy'), Dummy)
+        self.assertIs(file_storage.classes()['Dummy'], Dummy)
+
+    def test_classes_contains_models(self):
+        """Test classes lists the built-in models without copying"""
+        all_classes = file_storage.classes()
+        for name in ('BaseModel', 'User', 'State', 'City',
+                     'Amenity', 'Place', 'Review'):
+            self.assertIn(name, all_classes)
+        self.assertIs(file_storage.classes(), all_classes)
+        with self.assertRaises(TypeError):
+            all_classes['Other'] = object
+
+
+if __name__ == '__main__':
+    unittest.main()
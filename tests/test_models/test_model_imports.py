@@ -0,0 +1,34 @@
+#!/usr/bin/python3
+"""
+Test that the model modules do not import SQLAlchemy in file mode
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+
+class TestFileModeImports(unittest.TestCase):
+    """Test import side effects of the model modules in file mode"""
+
+    def test_models_do_not_import_sqlalchemy(self):
+        """Test user, place, review and amenity add no db imports"""
+        code = (
+            "import sys\n"
+            "import models, models.base_model\n"
+            "before = set(sys.modules)\n"
+            "import models.user, models.place, models.review\n"
+            "import models.amenity\n"
+            "added = [m for m in set(sys.modules) - before\n"
+            "         if m.split('.')[0] in ('sqlalchemy', 'MySQLdb')]\n"
+            "assert not added, sorted(added)\n"
+        )
+        env = dict(os.environ, HBNB_TYPE_STORAGE='file')
+        result = subprocess.run([sys.executable, "-c", code], env=env,
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,221 @@
+#!/usr/bin/python3
+"""
+Test cases for Place model
+"""
+
+import copy
+import json
+import os
+import pickle
+import unittest
+from unittest import mock
+from models import storage
+from models.amenity import Amenity
+from models.place import AmenityIds, Place
+
+
+@unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                 "File storage tests only")
+class TestPlaceAmenities(unittest.TestCase):
+    """Test the file storage amenities getter and setter"""
+
+    def test_amenities_keeps_order_and_skips_missing(self):
+        """Test amenities follows amenity_ids and skips unknown ids"""
+        first = Amenity(name="Wifi")
+        second = Amenity(name="Pool")
+        storage.new(first)
+        storage.new(second)
+        place = Place()
+        place.amenity_ids = [second.id, "missing-id", first.id]
+        self.assertEqual(place.amenities, [second, first])
+
+    def test_amenities_empty_skips_storage(self):
+        """Test no storage lookup is made when no amenity is linked"""
+        place = Place()
+        with mock.patch('models.storage') as storage_mock:
+            self.assertEqual(place.amenities, [])
+        self.assertEqual(storage_mock.method_calls, [])
+
+    def test_amenities_uses_get_many(self):
+        """Test a single get_many call is used when storage has one"""
+        first = Amenity(name="Wifi")
+        second = Amenity(name="Pool")
+        place = Place()
+        place.amenity_ids = [second.id, "missing-id", first.id]
+        storage_mock = mock.Mock(spec=['get', 'get_many'])
+        storage_mock.get_many.return_value = [second, None, first]
+        with mock.patch('models.storage', storage_mock):
+            self.assertEqual(place.amenities, [second, first])
+        storage_mock.get_many.assert_called_once_with(
+            Amenity, [second.id, "missing-id", first.id])
+        storage_mock.get.assert_not_called()
+
+    def test_amenities_falls_back_to_get(self):
+        """Test get is called per id when storage has no get_many"""
+        first = Amenity(name="Wifi")
+        place = Place()
+        place.amenity_ids = ["missing-id", first.id]
+        found = {first.id: first}
+        storage_mock = mock.Mock(spec=['get'])
+        storage_mock.get.side_effect = lambda cls, i: found.get(i)
+        with mock.patch('models.storage', storage_mock):
+            self.assertEqual(place.amenities, [first])
+        self.assertEqual(storage_mock.get.call_count, 2)
+
+    def test_amenities_setter_links_once(self):
+        """Test the setter links an amenity only once"""
+        amenity = Amenity(name="Kitchen")
+        place = Place()
+        place.amenities = amenity
+        place.amenities = amenity
+        place.amenities = "not an amenity"
+        self.assertEqual(list(place.amenity_ids), [amenity.id])
+
+
+class TestAmenityIds(unittest.TestCase):
+    """Test the set-backed amenity_ids collection"""
+
+    def assertInSync(self, ids):
+        """Checks the list and its membership set agree"""
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(ids._ids, set(ids))
+
+    def test_append_extend_dedup(self):
+        """Test append and extend drop ids already linked"""
+        ids = AmenityIds(["a", "b", "a"])
+        ids.append("b")
+        ids.append("c")
+        ids.extend(["c", "d", "a", "d"])
+        ids += ["e", "a"]
+        self.assertEqual(ids, ["a", "b", "c", "d", "e"])
+        self.assertIn("d", ids)
+        self.assertNotIn("z", ids)
+        self.assertInSync(ids)
+
+    def test_discard_remove_pop(self):
+        """Test removal methods keep membership in sync"""
+        ids = AmenityIds(["a", "b", "c", "d", "e"])
+        ids.discard("b", "missing", "d")
+        self.assertEqual(ids, ["a", "c", "e"])
+        ids.remove("c")
+        with self.assertRaises(ValueError):
+            ids.remove("c")
+        self.assertEqual(ids.pop(), "e")
+        self.assertEqual(ids.pop(0), "a")
+        self.assertEqual(ids, [])
+        self.assertNotIn("a", ids)
+        self.assertInSync(ids)
+
+    def test_other_mutations_stay_in_sync(self):
+        """Test insert, item assignment, deletion and *= keep the set"""
+        ids = AmenityIds(["a", "b", "c"])
+        del ids[0]
+        self.assertNotIn("a", ids)
+        ids.append("a")
+        self.assertEqual(ids, ["b", "c", "a"])
+        ids.insert(0, "b")
+        ids.insert(0, "x")
+        self.assertEqual(ids, ["x", "b", "c", "a"])
+        ids[0] = "z"
+        self.assertIn("z", ids)
+        self.assertNotIn("x", ids)
+        ids[0] = "z"
+        ids[1:3] = ["y", "w", "v"]
+        self.assertEqual(ids, ["z", "y", "w", "v", "a"])
+        self.assertNotIn("b", ids)
+        del ids[1:4]
+        self.assertEqual(ids, ["z", "a"])
+        self.assertNotIn("w", ids)
+        ids *= 3
+        self.assertEqual(ids, ["z", "a"])
+        ids.append("b")
+        ids.sort()
+        ids.reverse()
+        self.assertEqual(ids, ["z", "b", "a"])
+        self.assertInSync(ids)
+        ids *= 0
+        self.assertEqual(ids, [])
+        self.assertInSync(ids)
+
+    def test_assigning_linked_id_raises(self):
+        """Test assigning an id that is already linked is refused"""
+        ids = AmenityIds(["a", "b", "c"])
+        with self.assertRaises(ValueError):
+            ids[0] = "b"
+        with self.assertRaises(ValueError):
+            ids[0:1] = ["c"]
+        with self.assertRaises(ValueError):
+            ids[0:1] = ["x", "x"]
+        self.assertEqual(ids, ["a", "b", "c"])
+        self.assertInSync(ids)
+
+    def test_copy_deepcopy_pickle(self):
+        """Test copies keep the type and the membership set"""
+        ids = AmenityIds(["a", "b"])
+        for other in (ids.copy(), copy.copy(ids), copy.deepcopy(ids),
+                      pickle.loads(pickle.dumps(ids))):
+            self.assertIsInstance(other, AmenityIds)
+            self.assertEqual(other, ["a", "b"])
+            self.assertIn("b", other)
+            self.assertInSync(other)
+
+
+@unittest.skipIf(os.getenv('HBNB_TYPE_STORAGE') == 'db',
+                 "File storage tests only")
+class TestPlaceAmenityIds(unittest.TestCase):
+    """Test the amenity_ids property of Place in file storage"""
+
+    def test_json_round_trip(self):
+        """Test the ids serialize as a list and come back as AmenityIds"""
+        place = Place()
+        place.amenity_ids = ["a", "b", "a"]
+        data = json.loads(json.dumps(place.to_dict()))
+        self.assertEqual(data["amenity_ids"], ["a", "b"])
+        reloaded = Place(**data)
+        self.assertIsInstance(reloaded.amenity_ids, AmenityIds)
+        self.assertEqual(reloaded.amenity_ids, ["a", "b"])
+        self.assertIn("b", reloaded.amenity_ids)
+
+    def test_read_has_no_side_effect(self):
+        """Test reading amenity_ids does not change the instance"""
+        place = Place()
+        before = place.to_dict()
+        self.assertNotIn("amenity_ids", before)
+        self.assertNotIn("a", place.amenity_ids)
+        self.assertEqual(place.amenities, [])
+        place.amenity_ids.discard("a")
+        place.amenity_ids.clear()
+        self.assertEqual(place.to_dict(), before)
+
+    def test_ids_stored_on_first_add(self):
+        """Test the collection is stored once an id is added"""
+        amenity = Amenity(name="Wifi")
+        place = Place()
+        place.amenities = amenity
+        self.assertEqual(place.to_dict()["amenity_ids"], [amenity.id])
+        other = Place()
+        ids = other.amenity_ids
+        ids.append("a")
+        ids.append("b")
+        self.assertIs(other.amenity_ids, ids)
+        self.assertEqual(other.to_dict()["amenity_ids"], ["a", "b"])
+
+    def test_ids_are_per_instance(self):
+        """Test two places do not share their amenity_ids"""
+        first = Place()
+        second = Place()
+        first.amenity_ids.append("a")
+        self.assertEqual(first.amenity_ids, ["a"])
+        self.assertEqual(second.amenity_ids, [])
+
+    def test_none_resets(self):
+        """Test assigning None gives an empty collection"""
+        place = Place()
+        place.amenity_ids = ["a"]
+        place.amenity_ids = None
+        self.assertIsInstance(place.amenity_ids, AmenityIds)
+        self.assertEqual(place.amenity_ids, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,28 @@
-from sqlalchemy import Column, String
-from sqlalchemy.orm import relationship
-from models.base_model import BaseModel, Base
+from os import getenv
+from models.base_model import BaseModel
 
-class User(BaseModel, Base):
-    __tablename__ = 'users'
-    email = Column(String(128), nullable=False)
-    password = Column(String(128), nullable=False)
-    first_name = Column(String(128), nullable=True)
-    last_name = Column(String(128), nullable=True)
+storage_t = getenv('HBNB_TYPE_STORAGE')
+
+if storage_t == 'db':
+    from sqlalchemy import Column, String
+    from sqlalchemy.orm import relationship
+    from models.base_model import Base
+else:
+    Base = object
 
-    # Add this:
-    reviews = relationship("Review", backref="user", cascade="all, delete, delete-orphan")
 
+class User(BaseModel, Base):
+    if storage_t == 'db':
+        __tablename__ = 'users'
+        email = Column(String(128), nullable=False)
+        password = Column(String(128), nullable=False)
+        first_name = Column(String(128), nullable=True)
+        last_name = Column(String(128), nullable=True)
+
+        # Add this:
+        reviews = relationship("Review", backref="user", cascade="all, delete, delete-orphan")
+    else:
+        email = ""
+        password = ""
+        first_name = ""
+        last_name = ""